@@ -0,0 +1,49 @@
+"""
+Shared pytest fixtures for the High School Management System API tests
+"""
+
+import copy
+import functools
+import pytest
+
+from app import app, activities
+
+
+@functools.cache
+def _get_client():
+    """Build the shared test client on first use"""
+    # Deferred import keeps starlette.testclient out of collection-only runs
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client shared across the whole test session"""
+    # httpx.ASGITransport only supports async clients, so keep TestClient and
+    # pay its portal/lifespan startup once per session instead
+    with _get_client() as test_client:
+        # Warm up routing and middleware so the first test doesn't pay for it
+        test_client.get("/activities")
+        yield test_client
+
+
+# Snapshot of the initial state, taken before any test mutates it
+_SNAPSHOT = copy.deepcopy(activities)
+
+
+@pytest.fixture
+def reset_activities():
+    """Reset activities to initial state after a test that mutates them"""
+    yield
+
+    # Reset to original state after each test
+    activities.clear()
+    activities.update(copy.deepcopy(_SNAPSHOT))
+
+
+@pytest.fixture(scope="class")
+def activities_response(client):
+    """Fetch GET /activities once and share it across a read-only test class"""
+    return client.get("/activities")
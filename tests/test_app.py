@@ -2,89 +2,28 @@
 Tests for the High School Management System API
 """
 
-import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
-
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from urllib.parse import quote
 
-from app import app, activities
+import pytest
 
+from app import activities
 
-@pytest.fixture
-def client():
-    """Create a test client"""
-    return TestClient(app)
+EXPECTED_ACTIVITIES = [
+    "Chess Club",
+    "Programming Class",
+    "Gym Class",
+    "Basketball Team",
+    "Swimming Club",
+    "Art Studio",
+    "Drama Club",
+    "Debate Team",
+    "Science Olympiad",
+]
 
+# Request paths for each activity, URL-quoted once
+PATHS = {name: f"/activities/{quote(name)}" for name in EXPECTED_ACTIVITIES}
 
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Join the school basketball team and compete in tournaments",
-            "schedule": "Tuesdays and Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": ["james@mergington.edu"]
-        },
-        "Swimming Club": {
-            "description": "Develop swimming skills and participate in swim meets",
-            "schedule": "Mondays and Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 25,
-            "participants": ["sarah@mergington.edu", "alex@mergington.edu"]
-        },
-        "Art Studio": {
-            "description": "Explore painting, drawing, and mixed media art",
-            "schedule": "Thursdays, 3:30 PM - 5:30 PM",
-            "max_participants": 18,
-            "participants": ["isabella@mergington.edu"]
-        },
-        "Drama Club": {
-            "description": "Perform in school plays and learn acting techniques",
-            "schedule": "Wednesdays, 3:30 PM - 5:30 PM",
-            "max_participants": 20,
-            "participants": ["liam@mergington.edu", "mia@mergington.edu"]
-        },
-        "Debate Team": {
-            "description": "Compete in debates and develop critical thinking skills",
-            "schedule": "Tuesdays, 4:00 PM - 5:30 PM",
-            "max_participants": 16,
-            "participants": ["noah@mergington.edu"]
-        },
-        "Science Olympiad": {
-            "description": "Compete in STEM challenges and science competitions",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 20,
-            "participants": ["ava@mergington.edu", "ethan@mergington.edu"]
-        }
-    }
-    
-    yield
-    
-    # Reset to original state after each test
-    activities.clear()
-    activities.update(original_activities)
+ACTIVITY_FIELDS = ["description", "schedule", "max_participants", "participants"]
 
 
 class TestRootEndpoint:
@@ -100,188 +39,140 @@ class TestRootEndpoint:
 class TestActivitiesEndpoint:
     """Tests for the /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, activities_response):
         """Test that GET /activities returns all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+        assert activities_response.status_code == 200
+        data = activities_response.json()
         
         # Verify all activities are returned
-        assert len(data) == 9
-        assert "Chess Club" in data
-        assert "Programming Class" in data
-        assert "Gym Class" in data
-        assert "Basketball Team" in data
-        assert "Swimming Club" in data
-        assert "Art Studio" in data
-        assert "Drama Club" in data
-        assert "Debate Team" in data
-        assert "Science Olympiad" in data
+        assert len(data) == len(EXPECTED_ACTIVITIES)
+        assert set(EXPECTED_ACTIVITIES) <= data.keys()
     
-    def test_get_activities_returns_correct_structure(self, client):
-        """Test that activities have correct structure"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
+    @pytest.mark.parametrize("name", EXPECTED_ACTIVITIES)
+    def test_get_activities_returns_correct_structure(self, activities_response, name):
+        """Test that each activity has the correct structure"""
+        assert activities_response.status_code == 200
+        activity = activities_response.json()[name]
         
-        # Check structure of one activity
-        chess_club = data["Chess Club"]
-        assert "description" in chess_club
-        assert "schedule" in chess_club
-        assert "max_participants" in chess_club
-        assert "participants" in chess_club
-        assert isinstance(chess_club["participants"], list)
+        assert set(ACTIVITY_FIELDS) <= activity.keys()
+        assert isinstance(activity["participants"], list)
+        
+        # Participants are unique, so list membership checks behave like a set
+        assert len(set(activity["participants"])) == len(activity["participants"])
 
 
 class TestSignupEndpoint:
     """Tests for the signup endpoint"""
     
-    def test_signup_successful(self, client):
+    def test_signup_successful(self, client, reset_activities):
         """Test successful signup for an activity"""
         response = client.post(
-            "/activities/Chess Club/signup?email=newstudent@mergington.edu"
+            f"{PATHS['Chess Club']}/signup",
+            params={"email": "newstudent@mergington.edu"},
         )
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Signed up newstudent@mergington.edu for Chess Club"
         
         # Verify student was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "newstudent@mergington.edu" in activities_data["Chess Club"]["participants"]
-    
-    def test_signup_activity_not_found(self, client):
-        """Test signup for non-existent activity"""
-        response = client.post(
-            "/activities/Non-Existent Activity/signup?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+        assert "newstudent@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_already_registered(self, client):
-        """Test signup when student is already registered"""
-        # Student is already in Chess Club
-        response = client.post(
-            "/activities/Chess Club/signup?email=michael@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student already signed up"
+    @pytest.mark.parametrize("path,email,code,body", [
+        ("/activities/Non-Existent Activity", "test@mergington.edu", 404, b'{"detail":"Activity not found"}'),
+        (PATHS["Chess Club"], "michael@mergington.edu", 400, b'{"detail":"Student already signed up"}'),
+    ])
+    def test_signup_errors(self, client, path, email, code, body):
+        """Test signup for a non-existent activity or an already registered student"""
+        response = client.post(f"{path}/signup", params={"email": email})
+        assert response.status_code == code
+        assert response.content == body
     
-    def test_signup_multiple_activities(self, client):
+    def test_signup_multiple_activities(self, client, reset_activities):
         """Test that a student can sign up for multiple activities"""
         email = "multitask@mergington.edu"
         
         # Sign up for first activity
-        response1 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response1 = client.post(f"{PATHS['Chess Club']}/signup", params={"email": email})
         assert response1.status_code == 200
         
         # Sign up for second activity
-        response2 = client.post(f"/activities/Art Studio/signup?email={email}")
+        response2 = client.post(f"{PATHS['Art Studio']}/signup", params={"email": email})
         assert response2.status_code == 200
         
         # Verify student is in both
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
-        assert email in activities_data["Art Studio"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email in activities["Art Studio"]["participants"]
 
 
 class TestUnregisterEndpoint:
     """Tests for the unregister endpoint"""
     
-    def test_unregister_successful(self, client):
+    def test_unregister_successful(self, client, reset_activities):
         """Test successful unregister from an activity"""
         response = client.delete(
-            "/activities/Chess Club/unregister?email=michael@mergington.edu"
+            f"{PATHS['Chess Club']}/unregister",
+            params={"email": "michael@mergington.edu"},
         )
         assert response.status_code == 200
         data = response.json()
         assert data["message"] == "Unregistered michael@mergington.edu from Chess Club"
         
         # Verify student was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_activity_not_found(self, client):
-        """Test unregister from non-existent activity"""
-        response = client.delete(
-            "/activities/Non-Existent Activity/unregister?email=test@mergington.edu"
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
+    @pytest.mark.parametrize("path,email,code,body", [
+        ("/activities/Non-Existent Activity", "test@mergington.edu", 404, b'{"detail":"Activity not found"}'),
+        (PATHS["Chess Club"], "notregistered@mergington.edu", 400, b'{"detail":"Student not registered for this activity"}'),
+    ])
+    def test_unregister_errors(self, client, path, email, code, body):
+        """Test unregister from a non-existent activity or by an unregistered student"""
+        response = client.delete(f"{path}/unregister", params={"email": email})
+        assert response.status_code == code
+        assert response.content == body
     
-    def test_unregister_not_registered(self, client):
-        """Test unregister when student is not registered"""
-        response = client.delete(
-            "/activities/Chess Club/unregister?email=notregistered@mergington.edu"
-        )
-        assert response.status_code == 400
-        data = response.json()
-        assert data["detail"] == "Student not registered for this activity"
-    
-    def test_unregister_and_resign(self, client):
+    def test_unregister_and_resign(self, client, reset_activities):
         """Test that a student can unregister and sign up again"""
         email = "michael@mergington.edu"
         
         # Unregister
-        response1 = client.delete(f"/activities/Chess Club/unregister?email={email}")
+        response1 = client.delete(f"{PATHS['Chess Club']}/unregister", params={"email": email})
         assert response1.status_code == 200
         
         # Sign up again
-        response2 = client.post(f"/activities/Chess Club/signup?email={email}")
+        response2 = client.post(f"{PATHS['Chess Club']}/signup", params={"email": email})
         assert response2.status_code == 200
         
         # Verify student is registered
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data["Chess Club"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
 
 
 class TestIntegrationScenarios:
     """Integration tests combining multiple operations"""
     
-    def test_full_lifecycle(self, client):
+    def test_full_lifecycle(self, client, reset_activities):
         """Test a complete lifecycle: signup, verify, unregister, verify"""
         email = "lifecycle@mergington.edu"
         activity = "Drama Club"
         
         # Initial state - student not registered
-        activities_response = client.get("/activities")
-        initial_data = activities_response.json()
-        assert email not in initial_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
         
-        # Sign up
-        signup_response = client.post(f"/activities/{activity}/signup?email={email}")
-        assert signup_response.status_code == 200
-        
-        # Verify signup
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email in data[activity]["participants"]
+        # Sign up, then verify
+        assert client.post(f"{PATHS[activity]}/signup", params={"email": email}).status_code == 200
+        assert email in activities[activity]["participants"]
         
-        # Unregister
-        unregister_response = client.delete(f"/activities/{activity}/unregister?email={email}")
-        assert unregister_response.status_code == 200
-        
-        # Verify unregistration
-        activities_response = client.get("/activities")
-        final_data = activities_response.json()
-        assert email not in final_data[activity]["participants"]
+        # Unregister, then verify
+        assert client.delete(f"{PATHS[activity]}/unregister", params={"email": email}).status_code == 200
+        assert email not in activities[activity]["participants"]
     
-    def test_activity_independence(self, client):
+    def test_activity_independence(self, client, reset_activities):
         """Test that activities are independent of each other"""
         email = "independent@mergington.edu"
         
         # Sign up for Chess Club
-        client.post(f"/activities/Chess Club/signup?email={email}")
+        client.post(f"{PATHS['Chess Club']}/signup", params={"email": email})
         
         # Verify only in Chess Club, not in other activities
-        activities_response = client.get("/activities")
-        data = activities_response.json()
-        assert email in data["Chess Club"]["participants"]
-        assert email not in data["Programming Class"]["participants"]
-        assert email not in data["Art Studio"]["participants"]
+        assert email in activities["Chess Club"]["participants"]
+        assert email not in activities["Programming Class"]["participants"]
+        assert email not in activities["Art Studio"]["participants"]